@@ -51,6 +51,19 @@ data class MarkedCellInfo(
     val word: String
 )
 
+@Serializable
+data class MarkedCellsUpdate(
+    val player_id: String,
+    val cells: List<List<Int>>,  // [row, col] pairs of all marked cells
+    val has_bingo: Boolean
+)
+
+@Serializable
+data class BingoInfo(
+    val player_id: String,
+    val player_name: String
+)
+
 @Serializable
 data class WebSocketMessage(
     val type: String,
@@ -60,7 +73,9 @@ data class WebSocketMessage(
     val players: List<PlayerState>? = null,
     val message: String? = null,
     val text: String? = null,  // for transcript messages
-    val marked_cells: List<MarkedCellInfo>? = null  // cells marked by transcription
+    val marked_cells: List<MarkedCellInfo>? = null,  // cells marked by transcription
+    val updates: List<MarkedCellsUpdate>? = null,  // for batched_update and transcribe_result messages
+    val bingo: List<BingoInfo>? = null  // players whose update completed a line
 )
 
 /**
@@ -95,6 +110,9 @@ class BingoApiClient(
     private var currentPlayerId: String? = null
     private var currentMeetingId: String? = null
 
+    /** Our own state, kept so cell deltas from the server can be applied to it */
+    private var myState: PlayerState? = null
+
     /** Get the current player ID (our own ID) */
     fun getPlayerId(): String? = currentPlayerId
 
@@ -137,6 +155,13 @@ class BingoApiClient(
 
             currentPlayerId = joinResponse.player_id
             currentMeetingId = joinResponse.meeting_id
+            myState = PlayerState(
+                player_id = joinResponse.player_id,
+                player_name = playerName,
+                marked_cells = List(5) { List(5) { false } },
+                has_bingo = false,
+                connected = true
+            )
             _otherPlayers.value = joinResponse.players
 
             // Connect WebSocket for real-time updates
@@ -233,6 +258,7 @@ class BingoApiClient(
         } finally {
             currentPlayerId = null
             currentMeetingId = null
+            myState = null
             _connectionState.value = ConnectionState.DISCONNECTED
             _otherPlayers.value = emptyList()
         }
@@ -310,14 +336,12 @@ class BingoApiClient(
             }
             "player_updated" -> {
                 message.player?.let { player ->
-                    _otherPlayers.value = _otherPlayers.value.map {
-                        if (it.player_id == player.player_id) player else it
-                    }
-                    scope.launch {
-                        _events.emit(GameEvent.PlayerUpdated(player))
-                    }
+                    updatePlayer(player)
                 }
             }
+            "batched_update" -> {
+                applyUpdates(message)
+            }
             "bingo" -> {
                 val playerId = message.player_id ?: return
                 val playerName = message.player_name ?: "Unknown"
@@ -325,7 +349,9 @@ class BingoApiClient(
                     _events.emit(GameEvent.Bingo(playerId, playerName))
                 }
             }
-            "transcript" -> {
+            "transcript", "transcribe_result" -> {
+                // transcribe_result also carries the marked cells and any bingo
+                applyUpdates(message)
                 val text = message.text ?: ""
                 val markedCells = message.marked_cells ?: emptyList()
                 scope.launch {
@@ -340,4 +366,45 @@ class BingoApiClient(
             }
         }
     }
+
+    /**
+     * Apply the marked cells and bingo notices of a batched_update style message.
+     */
+    private fun applyUpdates(message: WebSocketMessage) {
+        message.updates?.forEach { update ->
+            applyMarks(update.player_id, update.cells.map { it[0] to it[1] }, update.has_bingo)
+        }
+        message.bingo?.forEach { bingo ->
+            scope.launch {
+                _events.emit(GameEvent.Bingo(bingo.player_id, bingo.player_name))
+            }
+        }
+    }
+
+    /**
+     * Replace the marked cells in the cached state of a player. Updates carry
+     * the player's full board, so a dropped message is repaired by the next one.
+     */
+    private fun applyMarks(playerId: String, cells: List<Pair<Int, Int>>, hasBingo: Boolean) {
+        val base = if (playerId == currentPlayerId) {
+            myState
+        } else {
+            _otherPlayers.value.find { it.player_id == playerId }
+        } ?: return
+        val markedCells = base.marked_cells.map { row -> MutableList(row.size) { false } }
+        cells.forEach { (row, col) -> markedCells[row][col] = true }
+        updatePlayer(base.copy(marked_cells = markedCells, has_bingo = hasBingo))
+    }
+
+    private fun updatePlayer(player: PlayerState) {
+        if (player.player_id == currentPlayerId) {
+            myState = player
+        }
+        _otherPlayers.value = _otherPlayers.value.map {
+            if (it.player_id == player.player_id) player else it
+        }
+        scope.launch {
+            _events.emit(GameEvent.PlayerUpdated(player))
+        }
+    }
 }
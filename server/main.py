@@ -7,32 +7,108 @@ Includes local Whisper transcription for speech-to-text.
 """
 
 import asyncio
+import heapq
 import io
-import json
+import logging
 import os
 import re
-import tempfile
-import uuid
-from datetime import datetime
-from typing import Dict, List, Optional, Set
+import secrets
+import struct
+import time
+import wave
+from typing import Dict, List, Optional, Sequence, Set, Tuple, Union
 from dataclasses import dataclass, field, asdict
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
 
+import msgspec
+import numpy as np
+import orjson
+import redis.asyncio as aioredis
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException, UploadFile, File, Form, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
-from nltk.stem import PorterStemmer
+import snowballstemmer
 
-# Initialize stemmer for word matching
-stemmer = PorterStemmer()
+logging.basicConfig(level=os.environ.get("LOG_LEVEL", "INFO"), format="%(asctime)s %(levelname)s %(message)s")
+log = logging.getLogger("bingo")
+
+# Initialize stemmer for word matching (C-backed when PyStemmer is installed)
+stemmer = snowballstemmer.stemmer("porter")
+# Transcripts repeat the same tokens heavily, so stems are cached per word
+STEM_CACHE: Dict[str, str] = {}
+STEM_CACHE_SIZE = 10000
+# Runs of punctuation, stripped from transcripts and board phrases
+PUNCT_RE = re.compile(r'[^\w\s]+')
 
 # Whisper model - loaded at startup
 from faster_whisper import WhisperModel
 
+WHISPER_SAMPLE_RATE = 16000
+# Larger uploads are rejected with 413 (5 MB is ~2.5 min of 16 kHz 16-bit mono)
+MAX_AUDIO_BYTES = int(os.environ.get("MAX_AUDIO_BYTES", 5_000_000))
+# Whole /api/transcribe request, leaving room for the other form fields and multipart framing
+MAX_TRANSCRIBE_REQUEST_BYTES = MAX_AUDIO_BYTES + 64 * 1024
+
+# Whisper releases the GIL during inference, so transcriptions run in a thread
+# pool (in parallel up to WHISPER_WORKERS) instead of blocking the event loop
+WHISPER_WORKERS = int(os.environ.get("WHISPER_WORKERS", "2"))
+TRANSCRIBE_POOL = ThreadPoolExecutor(max_workers=WHISPER_WORKERS, thread_name_prefix="whisper")
+transcribe_slots = asyncio.Semaphore(WHISPER_WORKERS)
+
+# int8 runs on VNNI dot-product instructions on CPUs that have them
+# (ctranslate2.get_supported_compute_types("cpu") lists what a host supports).
+# By default the cores are split between the parallel transcriptions, and the
+# model gets one worker per pool thread so they really do run in parallel.
+WHISPER_COMPUTE_TYPE = os.environ.get("WHISPER_COMPUTE", "int8")
+WHISPER_CPU_THREADS = int(os.environ.get("WHISPER_CPU_THREADS", max(1, (os.cpu_count() or 4) // WHISPER_WORKERS)))
+WHISPER_NUM_WORKERS = int(os.environ.get("WHISPER_NUM_WORKERS", WHISPER_WORKERS))
+
 model_size = os.environ.get("WHISPER_MODEL", "base")
-print(f"[WHISPER] Loading faster-whisper model ({model_size})...")
-whisper_model = WhisperModel(model_size, device="cpu", compute_type="int8")
-print("[WHISPER] Model loaded successfully")
+log.info("[WHISPER] Loading faster-whisper model (%s, %s, %d threads x %d workers)...",
+         model_size, WHISPER_COMPUTE_TYPE, WHISPER_CPU_THREADS, WHISPER_NUM_WORKERS)
+whisper_model = WhisperModel(model_size, device="cpu", compute_type=WHISPER_COMPUTE_TYPE,
+                             cpu_threads=WHISPER_CPU_THREADS, num_workers=WHISPER_NUM_WORKERS)
+log.info("[WHISPER] Model loaded successfully")
+
+
+# Board bitmasks - cell (row, col) is bit row*5 + col
+ROW_MASKS = tuple(0x1F << (5 * r) for r in range(5))
+COL_MASKS = tuple(sum(1 << (5 * r + c) for r in range(5)) for c in range(5))
+DIAG_MASK = sum(1 << (5 * i + i) for i in range(5))
+ANTI_DIAG_MASK = sum(1 << (5 * i + 4 - i) for i in range(5))
+WIN_LINES = ROW_MASKS + COL_MASKS + (DIAG_MASK, ANTI_DIAG_MASK)
+# For each cell, the (at most 4) winning lines passing through it
+LINES_THROUGH = tuple(tuple(line for line in WIN_LINES if line >> i & 1) for i in range(25))
+
+
+def cell_bit(row: int, col: int) -> int:
+    """Get the bitmask for a single board cell."""
+    return 1 << (row * 5 + col)
+
+
+def mask_to_cells(mask: int) -> List[List[bool]]:
+    """Expand a board bitmask into the 5x5 nested list sent to clients."""
+    return [[bool(mask >> (row * 5 + col) & 1) for col in range(5)] for row in range(5)]
+
+
+# Constant replies, serialized once
+PONG_PAYLOAD = '{"type":"pong"}'
+
+# Websocket subprotocol for clients that take player updates as binary frames.
+# Each update is a PLAYER_UPDATE_FRAME record: type u8 (FRAME_PLAYER_UPDATE),
+# has_bingo u8, marked_mask u32, player index u16, reserved u8 (little endian).
+# A batch is several records in one message; everything else stays JSON text.
+BINARY_SUBPROTOCOL = "bingo.binary"
+FRAME_PLAYER_UPDATE = 1
+PLAYER_UPDATE_FRAME = struct.Struct("<BBIHB")
+
+# How long marks are collected before being broadcast as one batched_update
+MARK_COALESCE_SECONDS = 0.05
+
+# Max queued outgoing messages per websocket before the oldest are dropped
+SEND_QUEUE_SIZE = 256
 
 
 # Data models
@@ -41,11 +117,20 @@ class PlayerState:
     player_id: str
     player_name: str
     client_ip: str = ""  # Track client IP to deduplicate players
-    marked_cells: List[List[bool]] = field(default_factory=lambda: [[False]*5 for _ in range(5)])
+    marked_mask: int = 0  # Bit row*5 + col is set when that cell is marked
+    index: int = 0  # Stable per-room number identifying the player in binary frames
     words: List[List[str]] = field(default_factory=lambda: [[""]*5 for _ in range(5)])
+    # (row, col, stem ids of the phrase) of each cell keyed by the phrase's
+    # first stem id, built once when the words are set (see index_phrases)
+    phrase_index: Dict[int, List[Tuple[int, int, Tuple[int, ...]]]] = field(default_factory=dict, repr=False)
+    # Ids of the stems on this player's board, so matching compares ints instead of strings
+    stem_to_id: Dict[str, int] = field(default_factory=dict, repr=False)
     has_bingo: bool = False
     connected: bool = True
-    last_seen: datetime = field(default_factory=datetime.now)
+    last_seen: float = field(default_factory=time.monotonic)
+    # Outgoing messages for this player's websocket, drained by socket_writer()
+    send_queue: Optional[asyncio.Queue] = field(default=None, repr=False, compare=False)
+    binary_frames: bool = False  # Websocket negotiated BINARY_SUBPROTOCOL
 
     def __post_init__(self):
         # Center cell is TEAM! - not pre-marked, but can be marked when someone says "TEAM!"
@@ -55,7 +140,8 @@ class PlayerState:
         return {
             "player_id": self.player_id,
             "player_name": self.player_name,
-            "marked_cells": self.marked_cells,
+            "index": self.index,
+            "marked_cells": mask_to_cells(self.marked_mask),
             "words": self.words,
             "has_bingo": self.has_bingo,
             "connected": self.connected
@@ -67,7 +153,44 @@ class GameRoom:
     meeting_id: str
     players: Dict[str, PlayerState] = field(default_factory=dict)
     websockets: Dict[str, WebSocket] = field(default_factory=dict)
-    created_at: datetime = field(default_factory=datetime.now)
+    created_at: float = field(default_factory=time.monotonic)
+    # Player ids per client IP, for finding stale players of a rejoining device
+    players_by_ip: Dict[str, Set[str]] = field(default_factory=dict)
+    # Tasks working on this room, cancelled when the room is closed
+    bg_tasks: Set[asyncio.Task] = field(default_factory=set)
+    # Players with cells marked since the last broadcast
+    pending_marks: Set[str] = field(default_factory=set)
+    flush_handle: Optional[asyncio.TimerHandle] = None
+    # Next PlayerState.index to hand out
+    next_index: int = 0
+
+    def add_player(self, player: PlayerState):
+        """Add a player to the room, giving it the next index."""
+        player.index = self.next_index
+        self.next_index = (self.next_index + 1) & 0xFFFF
+        self.players[player.player_id] = player
+        self.players_by_ip.setdefault(player.client_ip, set()).add(player.player_id)
+
+    def remove_player(self, player_id: str):
+        """Remove a player from the room and the client IP index."""
+        player = self.players.pop(player_id)
+        same_ip = self.players_by_ip[player.client_ip]
+        same_ip.discard(player_id)
+        if not same_ip:
+            del self.players_by_ip[player.client_ip]
+
+    def mark_cell(self, player: PlayerState, row: int, col: int):
+        """Mark a cell on a player's board and update the player's bingo from
+        the lines through the cell."""
+        player.marked_mask |= cell_bit(row, col)
+        player.has_bingo = player.has_bingo or completes_line(player.marked_mask, row, col)
+
+    def spawn(self, coro) -> asyncio.Task:
+        """Start a task tied to this room and keep a reference until it finishes."""
+        task = asyncio.create_task(coro)
+        self.bg_tasks.add(task)
+        task.add_done_callback(self.bg_tasks.discard)
+        return task
 
     def get_all_player_states(self, exclude_player_id: Optional[str] = None) -> List[dict]:
         """Get all player states, optionally excluding one player."""
@@ -80,60 +203,201 @@ class GameRoom:
 # Global game state
 game_rooms: Dict[str, GameRoom] = {}
 
+# Optional Redis pub/sub to relay broadcasts between uvicorn workers
+REDIS_URL = os.environ.get("REDIS_URL")
+REDIS_CHANNEL_PREFIX = "room:"
+WORKER_ID = secrets.token_hex(4)
+redis_client: Optional[aioredis.Redis] = None
+# (channel, message) pairs waiting for publish_redis_broadcasts(), so a slow
+# or unreachable Redis never holds up a broadcast
+redis_outbox: Optional[asyncio.Queue] = None
+REDIS_OUTBOX_SIZE = 1024
+# Pause before resubscribing after the relay lost its Redis connection
+REDIS_RETRY_SECONDS = 5.0
+
+# Rooms are deleted this long after creation
+ROOM_TTL_SECONDS = 3600
+
+# Min-heap of (expires_at, meeting_id), one entry per created room
+expiry_heap: List[Tuple[float, str]] = []
+# close_room() tasks of expired rooms. Closing runs in the background so a
+# stalled client can't hold up the request or cleanup pass that expired the room
+closing_rooms: Set[asyncio.Task] = set()
+
+
+def create_room(meeting_id: str) -> GameRoom:
+    """Create a game room and schedule its expiry."""
+    room = GameRoom(meeting_id=meeting_id)
+    game_rooms[meeting_id] = room
+    heapq.heappush(expiry_heap, (room.created_at + ROOM_TTL_SECONDS, meeting_id))
+    return room
+
+
+def expire_room(room: GameRoom, now: float):
+    """Remove a room that has outlived ROOM_TTL_SECONDS and start closing its websockets."""
+    log.info("[CLEANUP] Room %s expired (age: %.1f min)", room.meeting_id, (now - room.created_at) / 60)
+    del game_rooms[room.meeting_id]
+    task = asyncio.create_task(close_room(room, {"type": "room_expired", "message": "Game session expired"}))
+    closing_rooms.add(task)
+    task.add_done_callback(closing_rooms.discard)
+
+
+def get_room(meeting_id: str) -> Optional[GameRoom]:
+    """Look up a room, expiring it first if it is past its TTL.
+
+    Expired rooms are thus never served, even before cleanup_old_rooms gets to them.
+    """
+    room = game_rooms.get(meeting_id)
+    if room is not None:
+        now = time.monotonic()
+        if now - room.created_at >= ROOM_TTL_SECONDS:
+            expire_room(room, now)
+            return None
+    return room
+
 
 async def cleanup_old_rooms():
-    """Background task to clean up rooms older than 1 hour."""
+    """Background task to clean up rooms older than 1 hour that nobody accessed.
+
+    Sleeps until the earliest scheduled expiry instead of scanning all rooms.
+    """
     while True:
-        await asyncio.sleep(300)  # Check every 5 minutes
-        now = datetime.now()
-        rooms_to_delete = []
-
-        for meeting_id, room in game_rooms.items():
-            age_seconds = (now - room.created_at).total_seconds()
-            if age_seconds > 3600:  # 1 hour
-                rooms_to_delete.append(meeting_id)
-                print(f"[CLEANUP] Room {meeting_id} expired (age: {age_seconds/60:.1f} min)")
-
-        for meeting_id in rooms_to_delete:
-            room = game_rooms[meeting_id]
-            # Close all websockets
-            for ws in list(room.websockets.values()):
-                try:
-                    await ws.send_json({"type": "room_expired", "message": "Game session expired"})
-                    await ws.close()
-                except:
-                    pass
-            del game_rooms[meeting_id]
-
-        if rooms_to_delete:
-            print(f"[CLEANUP] Removed {len(rooms_to_delete)} expired rooms, {len(game_rooms)} rooms remaining")
+        now = time.monotonic()
+        expired_count = 0
+
+        while expiry_heap and expiry_heap[0][0] <= now:
+            _, meeting_id = heapq.heappop(expiry_heap)
+            room = game_rooms.get(meeting_id)
+            # The room may have been reset (and possibly re-created) since
+            if room is None or now - room.created_at < ROOM_TTL_SECONDS:
+                continue
+
+            expire_room(room, now)
+            expired_count += 1
+
+        if expired_count:
+            log.info("[CLEANUP] Removed %d expired rooms, %d rooms remaining", expired_count, len(game_rooms))
+
+        # Rooms created while sleeping expire after the current heap head (or a
+        # full TTL from now when the heap is empty), so no deadline is missed
+        await asyncio.sleep(max(1.0, expiry_heap[0][0] - now) if expiry_heap else ROOM_TTL_SECONDS)
+
+
+async def relay_redis_broadcasts():
+    """Background task forwarding broadcasts published by other workers to
+    the websockets connected to this worker. Resubscribes after Redis errors."""
+    while True:
+        try:
+            pubsub = redis_client.pubsub()
+            try:
+                await pubsub.psubscribe(REDIS_CHANNEL_PREFIX + "*")
+                async for message in pubsub.listen():
+                    if message["type"] != "pmessage":
+                        continue
+                    try:
+                        relay_message(message)
+                    except Exception as e:
+                        log.warning("[REDIS] Dropping malformed relay message: %s", e)
+            finally:
+                await pubsub.aclose()
+        except Exception as e:
+            log.warning("[REDIS] Relay subscription failed: %s (retrying in %.0fs)", e, REDIS_RETRY_SECONDS)
+            await asyncio.sleep(REDIS_RETRY_SECONDS)
+
+
+def relay_message(message: dict):
+    """Deliver a broadcast published by another worker to this worker's sockets."""
+    data = orjson.loads(message["data"])
+    if data["worker"] == WORKER_ID:
+        return
+    meeting_id = message["channel"].decode()[len(REDIS_CHANNEL_PREFIX):]
+    room = game_rooms.get(meeting_id)
+    if room:
+        deliver_payload(room, data["payload"], data["exclude"])
+
+
+async def publish_redis_broadcasts():
+    """Background task publishing queued broadcasts for the other workers."""
+    while True:
+        channel, message = await redis_outbox.get()
+        try:
+            await redis_client.publish(channel, message)
+        except Exception as e:
+            log.warning("[REDIS] Publish failed on %s: %s", channel, e)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    global redis_client, redis_outbox
     # Startup
-    print("Meeting Bingo Server starting...")
+    log.info("Meeting Bingo Server starting...")
     cleanup_task = asyncio.create_task(cleanup_old_rooms())
+    redis_tasks = []
+    if REDIS_URL:
+        redis_client = aioredis.from_url(REDIS_URL)
+        redis_outbox = asyncio.Queue(maxsize=REDIS_OUTBOX_SIZE)
+        redis_tasks = [asyncio.create_task(relay_redis_broadcasts()),
+                       asyncio.create_task(publish_redis_broadcasts())]
+        log.info("[REDIS] Relaying broadcasts via %s (worker %s)", REDIS_URL, WORKER_ID)
     yield
     # Shutdown
-    print("Meeting Bingo Server shutting down...")
+    log.info("Meeting Bingo Server shutting down...")
     cleanup_task.cancel()
+    TRANSCRIBE_POOL.shutdown(wait=False)
+    if redis_tasks:
+        for task in redis_tasks:
+            task.cancel()
+        await redis_client.aclose()
     # Close all websocket connections
     for room in game_rooms.values():
-        for ws in room.websockets.values():
-            try:
-                await ws.close()
-            except:
-                pass
+        await close_room(room)
+    await asyncio.gather(*closing_rooms, return_exceptions=True)
+
+
+class TranscribeSizeLimit:
+    """Reject /api/transcribe requests over MAX_TRANSCRIBE_REQUEST_BYTES before
+    the multipart form is received (FastAPI parses it, spooling files to disk,
+    before the endpoint runs). A large Content-Length is turned away at once;
+    bodies without one (chunked uploads) are counted as they stream in."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] != "/api/transcribe":
+            await self.app(scope, receive, send)
+            return
+
+        content_length = dict(scope["headers"]).get(b"content-length")
+        if content_length and content_length.isdigit() and int(content_length) > MAX_TRANSCRIBE_REQUEST_BYTES:
+            response = ORJSONResponse({"detail": "Audio too large"}, status_code=413)
+            await response(scope, receive, send)
+            return
+
+        received = 0
+
+        async def limited_receive():
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > MAX_TRANSCRIBE_REQUEST_BYTES:
+                    # Raised while the form is being parsed, so no response has started
+                    raise HTTPException(status_code=413, detail="Audio too large")
+            return message
+
+        await self.app(scope, limited_receive, send)
 
 
 app = FastAPI(
     title="Meeting Bingo Server",
     description="Multiplayer bingo game server for meetings",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
+app.add_middleware(TranscribeSizeLimit)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -155,7 +419,8 @@ class JoinGameResponse(BaseModel):
     players: List[dict]
 
 
-class MarkCellRequest(BaseModel):
+# Decoded with msgspec rather than pydantic, /api/mark is called on every click
+class MarkCellRequest(msgspec.Struct):
     meeting_id: str
     player_id: str
     row: int
@@ -171,46 +436,196 @@ class PlayerStateResponse(BaseModel):
 
 
 # Helper functions
-def check_bingo(marked_cells: List[List[bool]]) -> bool:
-    """Check if the player has achieved bingo."""
-    # Check rows
-    for row in marked_cells:
-        if all(row):
-            return True
+def completes_line(marked_mask: int, row: int, col: int) -> bool:
+    """Check if a line through the just-marked cell (row, col) is now complete.
 
-    # Check columns
-    for col in range(5):
-        if all(marked_cells[row][col] for row in range(5)):
+    Only lines through the newly marked cell can have been completed, so this
+    tests at most 4 lines instead of all 12.
+    """
+    for line in LINES_THROUGH[row * 5 + col]:
+        if (marked_mask & line) == line:
             return True
+    return False
 
-    # Check diagonals
-    if all(marked_cells[i][i] for i in range(5)):
-        return True
-    if all(marked_cells[i][4-i] for i in range(5)):
-        return True
 
-    return False
+def encode_message(message: dict) -> str:
+    """Serialize a message for sending over a WebSocket."""
+    return orjson.dumps(message).decode()
+
+
+async def send(ws: WebSocket, message: dict):
+    """Send a message to a single WebSocket."""
+    await ws.send_text(encode_message(message))
+
+
+async def receive(ws: WebSocket) -> dict:
+    """Receive a JSON message from a WebSocket (text or binary frame)."""
+    message = await ws.receive()
+    if message["type"] == "websocket.disconnect":
+        raise WebSocketDisconnect(message.get("code", 1000))
+    return orjson.loads(message.get("text") or message.get("bytes"))
+
+
+def player_update_frame(player: PlayerState) -> bytes:
+    """Encode a player's board as a binary PLAYER_UPDATE_FRAME record."""
+    return PLAYER_UPDATE_FRAME.pack(FRAME_PLAYER_UPDATE, player.has_bingo, player.marked_mask, player.index, 0)
+
+
+def mask_to_cell_list(mask: int) -> List[List[int]]:
+    """List the [row, col] pairs of the cells set in a board bitmask."""
+    return [[i // 5, i % 5] for i in range(25) if mask >> i & 1]
+
+
+def mark_update(player: PlayerState) -> dict:
+    """Describe a player's board for an "updates" list.
+
+    Carries all marked cells, not just the new ones, so clients replace their
+    copy and a message dropped from a full send queue is repaired by the next.
+    """
+    return {
+        "player_id": player.player_id,
+        "cells": mask_to_cell_list(player.marked_mask),
+        "has_bingo": player.has_bingo
+    }
+
+
+def queue_mark(room: GameRoom, player: PlayerState):
+    """Record that a player marked a cell, for the room's next batched broadcast.
+
+    All marks made within MARK_COALESCE_SECONDS of the first one are sent as
+    a single batched_update message, with one entry per player.
+    """
+    room.pending_marks.add(player.player_id)
+    if room.flush_handle is None:
+        room.flush_handle = asyncio.get_running_loop().call_later(MARK_COALESCE_SECONDS, schedule_flush, room)
+
+
+def schedule_flush(room: GameRoom):
+    room.spawn(flush_marks(room))
+
+
+async def flush_marks(room: GameRoom):
+    """Broadcast all pending marks of a room, and any resulting bingos, in one message."""
+    pending = room.pending_marks
+    room.pending_marks = set()
+    room.flush_handle = None
+
+    updates = []
+    frames = []
+    bingo = []
+    for player_id in pending:
+        player = room.players.get(player_id)
+        if player is None:
+            continue
+        updates.append(mark_update(player))
+        frames.append(player_update_frame(player))
+        if player.has_bingo:
+            bingo.append({"player_id": player_id, "player_name": player.player_name})
+
+    # Bingo notices ride along in the same frame instead of following as
+    # separate messages (binary frames carry has_bingo per record)
+    if updates:
+        await broadcast_payload(
+            room,
+            encode_message({"type": "batched_update", "updates": updates, "bingo": bingo}),
+            binary_payload=b"".join(frames)
+        )
 
 
 async def broadcast_to_room(room: GameRoom, message: dict, exclude_player_id: Optional[str] = None):
     """Broadcast a message to all connected players in a room."""
-    disconnected = []
-    # Create a copy of items to avoid RuntimeError during iteration
-    websocket_items = list(room.websockets.items())
-    for player_id, ws in websocket_items:
+    await broadcast_payload(room, encode_message(message), exclude_player_id)
+
+
+def enqueue(queue: asyncio.Queue, payload: Union[str, bytes]):
+    """Queue a payload for sending, dropping the oldest one if the queue is full."""
+    try:
+        queue.put_nowait(payload)
+    except asyncio.QueueFull:
+        queue.get_nowait()
+        queue.put_nowait(payload)
+
+
+async def socket_writer(room: GameRoom, player_id: str, ws: WebSocket, queue: asyncio.Queue):
+    """Send queued payloads to a player's websocket until it fails or is cancelled."""
+    try:
+        while True:
+            payload = await queue.get()
+            if isinstance(payload, bytes):
+                await ws.send_bytes(payload)
+            else:
+                await ws.send_text(payload)
+    except asyncio.CancelledError:
+        raise
+    except Exception:
+        # Clean up the disconnected websocket
+        if room.websockets.get(player_id) is ws:
+            del room.websockets[player_id]
+            if player_id in room.players:
+                room.players[player_id].connected = False
+
+
+async def broadcast_payload(room: GameRoom, payload: str, exclude_player_id: Optional[str] = None,
+                            binary_payload: Optional[bytes] = None, remote_payload: Optional[str] = None):
+    """Broadcast an already serialized message to all connected players in a room,
+    including players connected to other workers when Redis is configured.
+
+    If binary_payload is given, it is sent instead to sockets using BINARY_SUBPROTOCOL.
+    Binary records and player indexes are only meaningful on this worker, so
+    other workers always get the JSON form - remote_payload if given, else payload.
+    """
+    deliver_payload(room, payload, exclude_player_id, binary_payload)
+
+    if redis_outbox is not None:
+        try:
+            redis_outbox.put_nowait((REDIS_CHANNEL_PREFIX + room.meeting_id, orjson.dumps({
+                "worker": WORKER_ID,
+                "exclude": exclude_player_id,
+                "payload": remote_payload if remote_payload is not None else payload
+            })))
+        except asyncio.QueueFull:
+            log.warning("[REDIS] Outbox full, not relaying broadcast for room %s", room.meeting_id)
+
+
+def deliver_payload(room: GameRoom, payload: str, exclude_player_id: Optional[str] = None,
+                    binary_payload: Optional[bytes] = None):
+    """Queue a payload for the websockets connected to this worker.
+
+    Payloads are only queued here; each websocket has its own writer task, so a
+    slow client can't hold up the others and its backlog stays bounded.
+    """
+    for player_id in room.websockets:
         if player_id == exclude_player_id:
             continue
-        try:
-            await ws.send_json(message)
-        except:
-            disconnected.append(player_id)
+        player = room.players.get(player_id)
+        if player and player.send_queue:
+            if binary_payload is not None and player.binary_frames:
+                enqueue(player.send_queue, binary_payload)
+            else:
+                enqueue(player.send_queue, payload)
 
-    # Clean up disconnected websockets
-    for player_id in disconnected:
-        if player_id in room.websockets:
-            del room.websockets[player_id]
-        if player_id in room.players:
-            room.players[player_id].connected = False
+
+async def close_room(room: GameRoom, message: Optional[dict] = None):
+    """Close all websockets in a room, sending them a final message first,
+    and cancel the room's background tasks."""
+    payload = encode_message(message) if message else None
+
+    async def close_socket(ws: WebSocket):
+        if payload:
+            await ws.send_text(payload)
+        await ws.close()
+
+    # Close concurrently so one slow client doesn't delay the rest (the
+    # coroutines are all created before the first await, so no copy needed)
+    await asyncio.gather(*(close_socket(ws) for ws in room.websockets.values()),
+                         return_exceptions=True)
+
+    if room.flush_handle is not None:
+        room.flush_handle.cancel()
+    tasks = list(room.bg_tasks)
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
 
 
 # REST API endpoints
@@ -230,24 +645,20 @@ async def join_game(join_request: JoinGameRequest, request: Request):
     meeting_id = join_request.meeting_id
     player_name = join_request.player_name
     client_ip = request.client.host if request.client else "unknown"
-    player_id = str(uuid.uuid4())[:8]
+    player_id = secrets.token_hex(4)
 
     # Create room if it doesn't exist
-    if meeting_id not in game_rooms:
-        game_rooms[meeting_id] = GameRoom(meeting_id=meeting_id)
-        print(f"[JOIN] Created new room for meeting_id={meeting_id}")
-
-    room = game_rooms[meeting_id]
+    room = get_room(meeting_id)
+    if room is None:
+        room = create_room(meeting_id)
+        log.info("[JOIN] Created new room for meeting_id=%s", meeting_id)
 
     # Remove any existing players from the same IP (handles reconnects/app restarts)
     # This ensures one device = one player
-    players_to_remove = [
-        pid for pid, p in room.players.items()
-        if p.client_ip == client_ip
-    ]
+    players_to_remove = list(room.players_by_ip.get(client_ip, ()))
     for pid in players_to_remove:
         old_player = room.players[pid]
-        print(f"[JOIN] Removing duplicate player '{old_player.player_name}' (id={pid}) from same IP {client_ip}")
+        log.info("[JOIN] Removing duplicate player '%s' (id=%s) from same IP %s", old_player.player_name, pid, client_ip)
         # Close old websocket if exists
         if pid in room.websockets:
             try:
@@ -255,7 +666,7 @@ async def join_game(join_request: JoinGameRequest, request: Request):
             except:
                 pass
             del room.websockets[pid]
-        del room.players[pid]
+        room.remove_player(pid)
         # Notify others about the removal
         await broadcast_to_room(room, {
             "type": "player_left",
@@ -269,15 +680,18 @@ async def join_game(join_request: JoinGameRequest, request: Request):
         player_name=player_name,
         client_ip=client_ip
     )
-    room.players[player_id] = player
+    room.add_player(player)
 
-    print(f"[JOIN] Player '{player_name}' (id={player_id}, ip={client_ip}) joined meeting_id={meeting_id} (total players: {len(room.players)})")
+    log.info("[JOIN] Player '%s' (id=%s, ip=%s) joined meeting_id=%s (total players: %d)",
+             player_name, player_id, client_ip, meeting_id, len(room.players))
 
-    # Broadcast player joined to others
-    await broadcast_to_room(room, {
-        "type": "player_joined",
-        "player": player.to_dict()
-    }, exclude_player_id=player_id)
+    # Broadcast player joined to others; indexes are numbered per worker, so
+    # other workers get the player without one
+    state = player.to_dict()
+    payload = encode_message({"type": "player_joined", "player": state})
+    del state["index"]
+    await broadcast_payload(room, payload, exclude_player_id=player_id,
+                            remote_payload=encode_message({"type": "player_joined", "player": state}))
 
     return JoinGameResponse(
         player_id=player_id,
@@ -287,17 +701,21 @@ async def join_game(join_request: JoinGameRequest, request: Request):
 
 
 @app.post("/api/mark")
-async def mark_cell(request: MarkCellRequest):
+async def mark_cell(request: Request):
     """Mark a cell on the player's board."""
-    meeting_id = request.meeting_id
-    player_id = request.player_id
-    row = request.row
-    col = request.col
+    try:
+        mark_request = msgspec.json.decode(await request.body(), type=MarkCellRequest)
+    except msgspec.DecodeError as e:
+        raise HTTPException(status_code=422, detail=str(e))
 
-    if meeting_id not in game_rooms:
-        raise HTTPException(status_code=404, detail="Room not found")
+    meeting_id = mark_request.meeting_id
+    player_id = mark_request.player_id
+    row = mark_request.row
+    col = mark_request.col
 
-    room = game_rooms[meeting_id]
+    room = get_room(meeting_id)
+    if room is None:
+        raise HTTPException(status_code=404, detail="Room not found")
 
     if player_id not in room.players:
         raise HTTPException(status_code=404, detail="Player not found")
@@ -306,23 +724,11 @@ async def mark_cell(request: MarkCellRequest):
 
     # Mark the cell
     if 0 <= row < 5 and 0 <= col < 5:
-        player.marked_cells[row][col] = True
-        player.has_bingo = check_bingo(player.marked_cells)
-        player.last_seen = datetime.now()
+        room.mark_cell(player, row, col)
+        player.last_seen = time.monotonic()
 
-    # Broadcast update to all players
-    await broadcast_to_room(room, {
-        "type": "player_updated",
-        "player": player.to_dict()
-    })
-
-    # If player got bingo, send special notification
-    if player.has_bingo:
-        await broadcast_to_room(room, {
-            "type": "bingo",
-            "player_id": player_id,
-            "player_name": player.player_name
-        })
+        # Broadcast the marked cell (and bingo, if any) with this tick's other marks
+        queue_mark(room, player)
 
     return {"status": "ok", "has_bingo": player.has_bingo}
 
@@ -330,10 +736,9 @@ async def mark_cell(request: MarkCellRequest):
 @app.get("/api/room/{meeting_id}")
 async def get_room_state(meeting_id: str):
     """Get the current state of a game room."""
-    if meeting_id not in game_rooms:
+    room = get_room(meeting_id)
+    if room is None:
         raise HTTPException(status_code=404, detail="Room not found")
-
-    room = game_rooms[meeting_id]
     return {
         "meeting_id": meeting_id,
         "players": room.get_all_player_states(),
@@ -344,11 +749,10 @@ async def get_room_state(meeting_id: str):
 @app.delete("/api/room/{meeting_id}/player/{player_id}")
 async def leave_game(meeting_id: str, player_id: str):
     """Leave a game room."""
-    if meeting_id not in game_rooms:
+    room = get_room(meeting_id)
+    if room is None:
         raise HTTPException(status_code=404, detail="Room not found")
 
-    room = game_rooms[meeting_id]
-
     if player_id in room.players:
         player = room.players[player_id]
         player.connected = False
@@ -370,27 +774,19 @@ async def leave_game(meeting_id: str, player_id: str):
 @app.post("/api/room/{meeting_id}/reset")
 async def reset_room(meeting_id: str):
     """Reset a game room - removes all players and resets state. For testing."""
-    if meeting_id not in game_rooms:
+    room = get_room(meeting_id)
+    if room is None:
         return {"status": "ok", "message": "Room did not exist"}
 
-    room = game_rooms[meeting_id]
+    # Delete the room first, so concurrent requests don't find it half closed
+    del game_rooms[meeting_id]
 
-    # Notify all players
-    await broadcast_to_room(room, {
+    # Notify all players and close their websockets
+    await close_room(room, {
         "type": "room_reset",
         "message": "Game has been reset"
     })
-
-    # Close all websockets
-    for ws in list(room.websockets.values()):
-        try:
-            await ws.close()
-        except:
-            pass
-
-    # Delete the room
-    del game_rooms[meeting_id]
-    print(f"[RESET] Room {meeting_id} has been reset")
+    log.info("[RESET] Room %s has been reset", meeting_id)
 
     return {"status": "ok", "message": f"Room {meeting_id} has been reset"}
 
@@ -398,22 +794,17 @@ async def reset_room(meeting_id: str):
 @app.post("/api/reset-all")
 async def reset_all_rooms():
     """Reset all game rooms. For testing/development."""
-    room_count = len(game_rooms)
+    rooms = list(game_rooms.values())
+    room_count = len(rooms)
+    game_rooms.clear()
 
     # Notify and close all
-    for meeting_id, room in list(game_rooms.items()):
-        await broadcast_to_room(room, {
-            "type": "room_reset",
-            "message": "Server reset - all games cleared"
-        })
-        for ws in list(room.websockets.values()):
-            try:
-                await ws.close()
-            except:
-                pass
-
-    game_rooms.clear()
-    print(f"[RESET] All {room_count} rooms have been reset")
+    message = {
+        "type": "room_reset",
+        "message": "Server reset - all games cleared"
+    }
+    await asyncio.gather(*(close_room(room, message) for room in rooms))
+    log.info("[RESET] All %d rooms have been reset", room_count)
 
     return {"status": "ok", "message": f"Reset {room_count} rooms"}
 
@@ -422,30 +813,35 @@ async def reset_all_rooms():
 @app.websocket("/ws/{meeting_id}/{player_id}")
 async def websocket_endpoint(websocket: WebSocket, meeting_id: str, player_id: str):
     """WebSocket connection for real-time game updates."""
-    await websocket.accept()
+    # Clients may opt into binary player update frames, JSON text is the default
+    binary_frames = BINARY_SUBPROTOCOL in websocket.scope.get("subprotocols", [])
+    await websocket.accept(subprotocol=BINARY_SUBPROTOCOL if binary_frames else None)
 
     # Validate room and player
-    if meeting_id not in game_rooms:
-        await websocket.send_json({"type": "error", "message": "Room not found"})
+    room = get_room(meeting_id)
+    if room is None:
+        await send(websocket, {"type": "error", "message": "Room not found"})
         await websocket.close()
         return
 
-    room = game_rooms[meeting_id]
-
     if player_id not in room.players:
-        await websocket.send_json({"type": "error", "message": "Player not found"})
+        await send(websocket, {"type": "error", "message": "Player not found"})
         await websocket.close()
         return
 
-    # Register websocket
+    # Register websocket along with its outgoing queue and writer
+    send_queue = asyncio.Queue(maxsize=SEND_QUEUE_SIZE)
+    writer_task = room.spawn(socket_writer(room, player_id, websocket, send_queue))
     room.websockets[player_id] = websocket
+    room.players[player_id].send_queue = send_queue
+    room.players[player_id].binary_frames = binary_frames
     room.players[player_id].connected = True
 
     # Send current state to newly connected player
-    await websocket.send_json({
+    enqueue(send_queue, encode_message({
         "type": "sync",
         "players": room.get_all_player_states(exclude_player_id=player_id)
-    })
+    }))
 
     # Notify others of reconnection
     await broadcast_to_room(room, {
@@ -457,71 +853,99 @@ async def websocket_endpoint(websocket: WebSocket, meeting_id: str, player_id: s
     try:
         while True:
             # Receive messages from client
-            data = await websocket.receive_json()
+            data = await receive(websocket)
+            player = room.players[player_id]
+            player.last_seen = time.monotonic()
+            msg_type = data.get("type")
 
-            if data.get("type") == "mark_cell":
+            if msg_type == "mark_cell":
                 row = data.get("row", -1)
                 col = data.get("col", -1)
 
                 if 0 <= row < 5 and 0 <= col < 5:
-                    player = room.players[player_id]
-                    player.marked_cells[row][col] = True
-                    player.has_bingo = check_bingo(player.marked_cells)
-                    player.last_seen = datetime.now()
-
-                    # Broadcast update
-                    await broadcast_to_room(room, {
-                        "type": "player_updated",
-                        "player": player.to_dict()
-                    })
-
-                    if player.has_bingo:
-                        await broadcast_to_room(room, {
-                            "type": "bingo",
-                            "player_id": player_id,
-                            "player_name": player.player_name
-                        })
+                    room.mark_cell(player, row, col)
+
+                    # Broadcast the marked cell (and bingo, if any) with this tick's other marks
+                    queue_mark(room, player)
 
-            elif data.get("type") == "ping":
-                await websocket.send_json({"type": "pong"})
-                room.players[player_id].last_seen = datetime.now()
+            elif msg_type == "ping":
+                enqueue(send_queue, PONG_PAYLOAD)
 
     except WebSocketDisconnect:
-        # Handle disconnect
-        if player_id in room.websockets:
-            del room.websockets[player_id]
-        if player_id in room.players:
-            room.players[player_id].connected = False
+        pass
+    finally:
+        writer_task.cancel()
+        # Handle disconnect, including a bad message ending the loop. Skip it if a
+        # newer connection of this player has replaced this socket (socket_writer
+        # may already have removed this one after a failed send).
+        if room.websockets.get(player_id, websocket) is websocket:
+            room.websockets.pop(player_id, None)
+            if player_id in room.players:
+                room.players[player_id].connected = False
 
-            await broadcast_to_room(room, {
-                "type": "player_disconnected",
-                "player_id": player_id,
-                "player_name": room.players[player_id].player_name
-            })
+                await broadcast_to_room(room, {
+                    "type": "player_disconnected",
+                    "player_id": player_id,
+                    "player_name": room.players[player_id].player_name
+                })
 
 
 # ============== TRANSCRIPTION ENDPOINTS ==============
 
 def normalize_text(text: str) -> str:
     """Normalize text for matching - lowercase, remove punctuation."""
-    return re.sub(r'[^\w\s]', '', text.lower())
+    return PUNCT_RE.sub('', text.lower())
 
 
 def split_hyphenated(text: str) -> List[str]:
     """Split hyphenated words into separate words, lowercase."""
     # Replace hyphens with spaces, then normalize
-    return re.sub(r'[^\w\s]', ' ', text.lower()).split()
+    return PUNCT_RE.sub(' ', text.lower()).split()
 
 
 def stem_words(words: List[str]) -> List[str]:
     """Apply Porter stemming to a list of words."""
-    return [stemmer.stem(w) for w in words]
+    new_words = [w for w in words if w not in STEM_CACHE]
+    if new_words:
+        if len(STEM_CACHE) > STEM_CACHE_SIZE:
+            STEM_CACHE.clear()
+        STEM_CACHE.update(zip(new_words, stemmer.stemWords(new_words)))
+    return [STEM_CACHE[w] for w in words]
+
+
+def stem_phrases(words: List[List[str]]) -> List[List[List[str]]]:
+    """Stem every cell's phrase (hyphenated words split); FREE and empty cells get no stems."""
+    return [
+        [stem_words(split_hyphenated(word)) if word and word.upper() != "FREE" else [] for word in row]
+        for row in words
+    ]
+
+
+def stem_ids(stems: List[str], stem_to_id: Dict[str, int]) -> Tuple[int, ...]:
+    """Map board phrase stems to ids, adding unseen stems to stem_to_id."""
+    return tuple(stem_to_id.setdefault(s, len(stem_to_id)) for s in stems)
+
 
+def index_phrases(phrase_stems: List[List[List[str]]],
+                  stem_to_id: Dict[str, int]) -> Dict[int, List[Tuple[int, int, Tuple[int, ...]]]]:
+    """Group the cells' phrase stem ids by their first stem id, skipping cells without stems.
+    The ids are assigned in stem_to_id. Cells outside the 5x5 board can't be
+    marked and are left out; a smaller word grid just indexes fewer cells."""
+    index = {}
+    for row, row_stems in enumerate(phrase_stems[:5]):
+        for col, stems in enumerate(row_stems[:5]):
+            if stems:
+                cell_ids = stem_ids(stems, stem_to_id)
+                index.setdefault(cell_ids[0], []).append((row, col, cell_ids))
+    return index
 
-def phrase_matches_transcript(phrase_stems: List[str], transcript_stems: List[str], max_gap: int = 3) -> bool:
+
+def phrase_matches_transcript(phrase_ids: Sequence[int], transcript_ids: Sequence[int], max_gap: int = 3,
+                              start: int = 0) -> bool:
     """
     Check if all stemmed words in the phrase appear in the transcript in order,
     allowing other words in between (up to max_gap words between consecutive matches).
+    Both are given as stem ids (see stem_ids).
 
     Example: phrase "think outside box" matches transcript "thinking outside the box"
              because stemmed forms match: "think" matches "think", etc.
@@ -531,35 +955,41 @@ def phrase_matches_transcript(phrase_stems: List[str], transcript_stems: List[st
     - "take it offline" (1 word gap)
     - "take this thing offline" (2 word gap)
     - "it's a win win" (0 word gap)
+
+    Matching begins at transcript position start (nothing before the first
+    occurrence of the phrase's first stem can match anyway).
     """
-    if not phrase_stems:
+    if not phrase_ids:
         return False
 
     phrase_idx = 0
     last_match_pos = -1
 
-    for i, transcript_stem in enumerate(transcript_stems):
-        if transcript_stem == phrase_stems[phrase_idx]:
+    for i in range(start, len(transcript_ids)):
+        transcript_id = transcript_ids[i]
+        if transcript_id == phrase_ids[phrase_idx]:
             # Check gap from previous match (skip for first match)
             if phrase_idx > 0 and (i - last_match_pos - 1) > max_gap:
                 # Gap too large, reset and try again from this position
                 phrase_idx = 0
-                if transcript_stem == phrase_stems[0]:
+                if transcript_id == phrase_ids[0]:
                     phrase_idx = 1
                     last_match_pos = i
                 continue
 
             last_match_pos = i
             phrase_idx += 1
-            if phrase_idx == len(phrase_stems):
+            if phrase_idx == len(phrase_ids):
                 return True
 
     return False
 
 
-def find_matching_words(transcript: str, words: List[List[str]]) -> List[tuple]:
+def find_matching_words(transcript: str, phrase_index: Dict[int, List[Tuple[int, int, Tuple[int, ...]]]],
+                        stem_to_id: Dict[str, int]) -> List[tuple]:
     """
-    Find which bingo words appear in the transcript.
+    Find which bingo words appear in the transcript, given the player's
+    phrase index and stem ids (see index_phrases).
     Returns list of (row, col) tuples for matching cells.
 
     Uses flexible matching:
@@ -568,37 +998,108 @@ def find_matching_words(transcript: str, words: List[List[str]]) -> List[tuple]:
     - Handles "Take Offline" matching "take it offline"
     - Handles "win-win" matching "win win" (hyphenated phrases split into words)
     - Uses max gap of 3 words to prevent matching across unrelated sentences
+
+    Only cells whose first stem occurs in the transcript are checked, starting
+    from that stem's first occurrence.
     """
     normalized_transcript = normalize_text(transcript)
     transcript_words = normalized_transcript.split()
-    transcript_stems = stem_words(transcript_words)
+    # Stems that aren't on any board can't match, so they all get id -1
+    transcript_ids = [stem_to_id.get(s, -1) for s in stem_words(transcript_words)]
     matches = []
 
-    for row in range(5):
-        for col in range(5):
-            word = words[row][col]
-            if not word or word.upper() == "FREE":
-                continue
+    first_positions = {}
+    for i, transcript_id in enumerate(transcript_ids):
+        first_positions.setdefault(transcript_id, i)
 
-            # Split hyphenated words (e.g., "win-win" -> ["win", "win"])
-            phrase_words = split_hyphenated(word)
+    for first_id, pos in first_positions.items():
+        for row, col, cell_ids in phrase_index.get(first_id, ()):
+            # Single words match on their own; multi-word phrases need the
+            # rest of their stemmed words in order (with gap limit)
+            if len(cell_ids) == 1 or phrase_matches_transcript(cell_ids, transcript_ids, start=pos):
+                matches.append((row, col))
 
-            if not phrase_words:
-                continue
+    return matches
 
-            # Stem the phrase words
-            phrase_stems = stem_words(phrase_words)
 
-            # For single words, use simple stemmed word matching
-            if len(phrase_stems) == 1:
-                if phrase_stems[0] in transcript_stems:
-                    matches.append((row, col))
-            else:
-                # For multi-word phrases, check if stemmed words appear in order (with gap limit)
-                if phrase_matches_transcript(phrase_stems, transcript_stems):
-                    matches.append((row, col))
+def log_wav_stats(audio_data: bytes):
+    """Log the format and level of a WAV upload, for debugging audio capture.
+
+    Levels are sampled from the first and middle half second, which is
+    enough for a sanity check without a pass over the whole upload.
+    """
+    try:
+        with wave.open(io.BytesIO(audio_data), 'rb') as wav:
+            channels = wav.getnchannels()
+            sample_width = wav.getsampwidth()
+            framerate = wav.getframerate()
+            n_frames = wav.getnframes()
+            duration = n_frames / framerate
+
+            # Read samples from the start and the middle
+            window = framerate // 2
+            frames = wav.readframes(window)
+            if n_frames > 2 * window:
+                wav.setpos(n_frames // 2)
+                frames += wav.readframes(window)
+            samples = np.frombuffer(frames, dtype=np.int16).astype(np.int64)
+
+            # Calculate audio stats
+            max_val = np.max(np.abs(samples)) if samples.size else 0
+            rms = np.sqrt(np.mean(samples * samples)) if samples.size else 0.0
+
+            log.debug("[TRANSCRIBE] WAV: %dch, %dbit, %dHz, %.2fs", channels, sample_width * 8, framerate, duration)
+            log.debug("[TRANSCRIBE] Audio stats (sampled): max=%d, rms=%.1f, max_possible=32767", max_val, rms)
+    except Exception as wav_err:
+        log.debug("[TRANSCRIBE] WAV analysis error: %s", wav_err)
+
+
+def load_audio(audio_data: bytes) -> Union[np.ndarray, io.BytesIO]:
+    """
+    Decode a 16 kHz 16-bit WAV upload straight into the float32 mono samples
+    Whisper works on. Any other format is passed on as a file object for
+    Whisper to decode and resample itself.
+    """
+    try:
+        with wave.open(io.BytesIO(audio_data), 'rb') as wav:
+            if wav.getsampwidth() == 2 and wav.getframerate() == WHISPER_SAMPLE_RATE:
+                channels = wav.getnchannels()
+                frames = wav.readframes(wav.getnframes())
+                # A truncated upload can end mid-frame; keep only whole frames
+                frames = frames[:len(frames) - len(frames) % (2 * channels)]
+                samples = np.frombuffer(frames, dtype=np.int16)
+                if channels > 1:
+                    samples = samples.reshape(-1, channels).mean(axis=1)
+                return samples.astype(np.float32) / 32768.0
+    except (wave.Error, EOFError):
+        pass
+    return io.BytesIO(audio_data)
 
-    return matches
+
+def transcribe_audio_data(audio_data: bytes) -> Tuple[str, str]:
+    """
+    Transcribe an audio upload with Whisper, returning (transcript, language).
+    Blocking - runs in TRANSCRIBE_POOL.
+    """
+    # Only parse the WAV for its stats when they'd actually be logged
+    if log.isEnabledFor(logging.DEBUG):
+        log_wav_stats(audio_data)
+
+    # Transcribe with Whisper. Clips are short and independent: the VAD filter
+    # skips silence, greedy decoding is enough for them and not conditioning
+    # on earlier text avoids repetition loops
+    segments, info = whisper_model.transcribe(
+        load_audio(audio_data),
+        language="en",
+        vad_filter=True,
+        vad_parameters={"min_silence_duration_ms": 500, "threshold": 0.5},
+        beam_size=1,
+        condition_on_previous_text=False
+    )
+
+    # Combine all segments - segments is a generator, decoding happens while iterating
+    transcript = " ".join(segment.text for segment in segments).strip()
+    return transcript, info.language
 
 
 @app.post("/api/transcribe")
@@ -612,62 +1113,36 @@ async def transcribe_audio(
     The player who submits audio is hearing others speak, so we only mark their cells.
     This prevents players from marking their own words by speaking them.
     """
-    print(f"[TRANSCRIBE] Received audio for meeting_id={meeting_id}, player_id={player_id}, size={audio.size if hasattr(audio, 'size') else 'unknown'}")
+    log.debug("[TRANSCRIBE] Received audio for meeting_id=%s, player_id=%s, size=%s",
+              meeting_id, player_id, audio.size if hasattr(audio, 'size') else 'unknown')
 
-    # Read audio data
+    # Read audio data. TranscribeSizeLimit already turned away requests with a
+    # large Content-Length; this catches chunked uploads that had none
+    if audio.size is not None and audio.size > MAX_AUDIO_BYTES:
+        raise HTTPException(status_code=413, detail="Audio too large")
     audio_data = await audio.read()
-    print(f"[TRANSCRIBE] Audio data size: {len(audio_data)} bytes")
-
-    # Save to temp file for Whisper
-    with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp_file:
-        tmp_file.write(audio_data)
-        tmp_path = tmp_file.name
+    log.debug("[TRANSCRIBE] Audio data size: %d bytes", len(audio_data))
 
     try:
-        # Analyze WAV file for debugging
-        import wave
-        import numpy as np
-        try:
-            with wave.open(tmp_path, 'rb') as wav:
-                channels = wav.getnchannels()
-                sample_width = wav.getsampwidth()
-                framerate = wav.getframerate()
-                n_frames = wav.getnframes()
-                duration = n_frames / framerate
-
-                # Read and analyze samples
-                frames = wav.readframes(n_frames)
-                samples = np.frombuffer(frames, dtype=np.int16)
-
-                # Calculate audio stats
-                max_val = np.max(np.abs(samples))
-                rms = np.sqrt(np.mean(samples.astype(np.float64)**2))
-
-                print(f"[TRANSCRIBE] WAV: {channels}ch, {sample_width*8}bit, {framerate}Hz, {duration:.2f}s")
-                print(f"[TRANSCRIBE] Audio stats: max={max_val}, rms={rms:.1f}, max_possible=32767")
-        except Exception as wav_err:
-            print(f"[TRANSCRIBE] WAV analysis error: {wav_err}")
-
-        # Transcribe with Whisper
-        segments, info = whisper_model.transcribe(tmp_path, language="en")
-
-        # Combine all segments
-        transcript = " ".join(segment.text for segment in segments).strip()
-        print(f"[TRANSCRIBE] Result: '{transcript}'")
+        # Run Whisper off the event loop; the semaphore makes extra requests
+        # wait here instead of piling up in the pool's queue
+        async with transcribe_slots:
+            loop = asyncio.get_running_loop()
+            transcript, language = await loop.run_in_executor(TRANSCRIBE_POOL, transcribe_audio_data, audio_data)
+        log.info("[TRANSCRIBE] Result: '%s'", transcript)
 
         # If room exists, check for matching words and mark cells for the submitting player ONLY
         marked_cells_info = []
-        if meeting_id in game_rooms:
-            room = game_rooms[meeting_id]
-
+        room = get_room(meeting_id)
+        if room is not None:
             # Only mark cells for the player who submitted the audio
             if player_id in room.players:
                 player = room.players[player_id]
-                matches = find_matching_words(transcript, player.words)
+                matches = find_matching_words(transcript, player.phrase_index, player.stem_to_id)
 
                 for row, col in matches:
-                    if not player.marked_cells[row][col]:
-                        player.marked_cells[row][col] = True
+                    if not player.marked_mask & cell_bit(row, col):
+                        room.mark_cell(player, row, col)
                         word = player.words[row][col]
                         marked_cells_info.append({
                             "player_id": player_id,
@@ -676,71 +1151,55 @@ async def transcribe_audio(
                             "col": col,
                             "word": word
                         })
-                        print(f"[TRANSCRIBE] Marked '{word}' for {player.player_name} at ({row},{col})")
-
-                # Check for bingo
-                if matches:
-                    player.has_bingo = check_bingo(player.marked_cells)
+                        log.info("[TRANSCRIBE] Marked '%s' for %s at (%d,%d)", word, player.player_name, row, col)
 
                 # Broadcast transcript to all players (so they can see what was heard)
+                # together with the cells it marked and any resulting bingo, in
+                # the same shape as a batched_update
                 await broadcast_to_room(room, {
-                    "type": "transcript",
+                    "type": "transcribe_result",
                     "text": transcript,
-                    "marked_cells": marked_cells_info
+                    "marked_cells": marked_cells_info,
+                    "updates": [mark_update(player)] if marked_cells_info else [],
+                    "bingo": [{"player_id": player_id, "player_name": player.player_name}] if marked_cells_info and player.has_bingo else []
                 })
-
-                # Broadcast updated state for the player who got cells marked
-                await broadcast_to_room(room, {
-                    "type": "player_updated",
-                    "player": player.to_dict()
-                })
-
-                if player.has_bingo:
-                    await broadcast_to_room(room, {
-                        "type": "bingo",
-                        "player_id": player_id,
-                        "player_name": player.player_name
-                    })
             else:
-                print(f"[TRANSCRIBE] Player {player_id} not found in room {meeting_id}")
+                log.warning("[TRANSCRIBE] Player %s not found in room %s", player_id, meeting_id)
 
         return {
             "status": "ok",
             "transcript": transcript,
-            "language": info.language,
+            "language": language,
             "marked_cells": marked_cells_info
         }
 
     except Exception as e:
-        print(f"[TRANSCRIBE] Error: {e}")
+        log.exception("[TRANSCRIBE] Error: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        # Clean up temp file
-        try:
-            os.unlink(tmp_path)
-        except:
-            pass
 
 
 @app.post("/api/room/{meeting_id}/player/{player_id}/words")
 async def set_player_words(meeting_id: str, player_id: str, words: List[List[str]]):
     """Set the bingo words for a player's card."""
-    if meeting_id not in game_rooms:
+    room = get_room(meeting_id)
+    if room is None:
         raise HTTPException(status_code=404, detail="Room not found")
 
-    room = game_rooms[meeting_id]
-
     if player_id not in room.players:
         raise HTTPException(status_code=404, detail="Player not found")
 
     player = room.players[player_id]
     player.words = words
+    stem_to_id = {}
+    player.phrase_index = index_phrases(stem_phrases(words), stem_to_id)
+    player.stem_to_id = stem_to_id
 
-    print(f"[WORDS] Set words for {player.player_name}: {sum(len(row) for row in words)} words")
+    log.info("[WORDS] Set words for %s: %d words", player.player_name, sum(len(row) for row in words))
 
     return {"status": "ok"}
 
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8080)
+    # uvloop/httptools come with uvicorn[standard]
+    uvicorn.run(app, host="0.0.0.0", port=8080, loop="uvloop", http="httptools", ws="websockets")